@@ -0,0 +1,27 @@
+-- Hourly price/spread rollup backing the dashboard's market summary
+-- Stores sums and sums of squares so daily AVG/STDDEV can be recombined
+-- from the hourly buckets
+
+CREATE MATERIALIZED VIEW market_ticks_1h
+WITH (timescaledb.continuous) AS
+SELECT
+    time_bucket(INTERVAL '1 hour', time) AS bucket,
+    COUNT(mid_price) AS mid_price_count,
+    MIN(mid_price) AS low,
+    MAX(mid_price) AS high,
+    SUM(mid_price) AS mid_price_sum,
+    SUM(mid_price * mid_price) AS mid_price_sum_sq,
+    COUNT(spread) AS spread_count,
+    SUM(spread) AS spread_sum,
+    MIN(spread) AS min_spread,
+    MAX(spread) AS max_spread
+FROM market_ticks
+GROUP BY bucket;
+
+-- Include not-yet-materialized ticks so the current hour is always counted
+ALTER MATERIALIZED VIEW market_ticks_1h SET (timescaledb.materialized_only = false);
+
+SELECT add_continuous_aggregate_policy('market_ticks_1h',
+    start_offset => INTERVAL '2 days',
+    end_offset => INTERVAL '1 hour',
+    schedule_interval => INTERVAL '5 minutes');
@@ -0,0 +1,172 @@
+"""
+Trading Dashboard API tests
+
+The database tests run against a real PostgreSQL server given by
+TEST_DATABASE_URL and are skipped without it. They create the tables they
+need in a throwaway schema, so TimescaleDB-only endpoints are not covered.
+"""
+
+import asyncio
+import os
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+import trading_dashboard
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+requires_database = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+)
+
+SCHEMA_SQL = """
+    CREATE TABLE market_ticks (
+        time TIMESTAMPTZ NOT NULL,
+        symbol TEXT NOT NULL,
+        bid NUMERIC(18, 8) NOT NULL,
+        bid_size NUMERIC(18, 8) NOT NULL,
+        ask NUMERIC(18, 8) NOT NULL,
+        ask_size NUMERIC(18, 8) NOT NULL,
+        spread NUMERIC(18, 8),
+        mid_price NUMERIC(18, 8),
+        simulation_id UUID
+    );
+    CREATE TABLE as_quotes (
+        time TIMESTAMPTZ NOT NULL,
+        our_bid NUMERIC(18, 8) NOT NULL,
+        our_ask NUMERIC(18, 8) NOT NULL,
+        our_spread NUMERIC(18, 8) NOT NULL,
+        position NUMERIC(18, 8) NOT NULL,
+        avg_entry_price NUMERIC(18, 8)
+    );
+    CREATE TABLE trading_stats (
+        time TIMESTAMPTZ NOT NULL,
+        realized_pnl NUMERIC(18, 8) NOT NULL,
+        unrealized_pnl NUMERIC(18, 8) NOT NULL,
+        total_pnl NUMERIC(18, 8) NOT NULL,
+        fill_count INTEGER NOT NULL,
+        quote_count INTEGER NOT NULL,
+        fill_rate NUMERIC(8, 4)
+    );
+    CREATE TABLE simulation_sessions (
+        simulation_id UUID PRIMARY KEY,
+        start_time TIMESTAMPTZ NOT NULL
+    );
+"""
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+@pytest.fixture
+async def db_pool():
+    """Dashboard pool limited to one connection, inside a scratch schema"""
+    import asyncpg
+    
+    schema = f"dashboard_test_{uuid.uuid4().hex}"
+    admin = await asyncpg.connect(TEST_DATABASE_URL)
+    await admin.execute(f"CREATE SCHEMA {schema}")
+    await admin.execute(f"SET search_path TO {schema}; {SCHEMA_SQL}")
+    
+    now = datetime.now(timezone.utc)
+    await admin.execute("""
+        INSERT INTO market_ticks
+        VALUES ($1, 'BTCUSDT', 100.0, 2.0, 101.0, 3.0, 1.0, 100.5, NULL)
+    """, now)
+    await admin.execute("""
+        INSERT INTO as_quotes VALUES ($1, 99.5, 101.5, 2.0, 0.01, 100.0)
+    """, now)
+    await admin.execute("""
+        INSERT INTO trading_stats VALUES ($1, 1.5, 0.25, 1.75, 3, 40, 0.075)
+    """, now)
+    
+    pool = await trading_dashboard.create_db_pool(
+        TEST_DATABASE_URL,
+        max_size=1,
+        server_settings={"search_path": schema}
+    )
+    try:
+        yield pool
+    finally:
+        await pool.close()
+        await admin.execute(f"DROP SCHEMA {schema} CASCADE")
+        await admin.close()
+
+@pytest.fixture
+async def client(db_pool):
+    trading_dashboard.app.dependency_overrides[trading_dashboard.get_pool] = lambda: db_pool
+    transport = httpx.ASGITransport(app=trading_dashboard.app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+    finally:
+        trading_dashboard.app.dependency_overrides.clear()
+
+@requires_database
+@pytest.mark.anyio
+@pytest.mark.parametrize("path", [
+    "/api/live-stats",
+    "/api/recent-ticks",
+    "/api/orderbook",
+    "/api/recent-trades",
+    "/api/trading-status",
+])
+async def test_endpoint_reuses_pooled_connection(client, path):
+    # The pool has a single connection, so both requests run on it and the
+    # second one happens after it has been released back to the pool once
+    for _ in range(2):
+        response = await client.get(path)
+        assert response.status_code == 200, response.text
+
+@requires_database
+@pytest.mark.anyio
+async def test_trading_status_reads_latest_rows(client):
+    response = await client.get("/api/trading-status")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["market_quotes"] == {"bid": 100.0, "ask": 101.0}
+    assert data["current_quotes"] == {"bid": 99.5, "ask": 101.5}
+    assert data["total_pnl"] == 1.75
+    assert data["fill_count"] == 3
+
+@pytest.mark.anyio
+@pytest.mark.skipif(os.name == 'nt', reason="uses /bin/sleep as a stand-in engine")
+async def test_concurrent_engine_starts_spawn_one_engine(monkeypatch):
+    # `sleep <duration>` behaves like an engine that runs for its duration
+    monkeypatch.setattr(trading_dashboard, "ENGINE_PATH", "/bin/sleep")
+    transport = httpx.ASGITransport(app=trading_dashboard.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        try:
+            first, second = await asyncio.gather(
+                client.post("/api/engine/start", json={"duration": 30}),
+                client.post("/api/engine/start", json={"duration": 30}),
+            )
+            assert sorted([first.status_code, second.status_code]) == [200, 400]
+        finally:
+            response = await client.post("/api/engine/stop")
+        
+        assert response.status_code == 200
+        assert trading_dashboard.engine_process is None
+
+@requires_database
+@pytest.mark.anyio
+async def test_market_summary_without_aggregate_only_fails_that_endpoint(client):
+    # The scratch schema has no market_ticks_1h continuous aggregate
+    response = await client.get("/api/market-summary")
+    assert response.status_code == 503
+    assert "04_market_summary_aggregate.sql" in response.json()["error"]
+    
+    response = await client.get("/api/live-stats")
+    assert response.status_code == 200
+
+@requires_database
+@pytest.mark.anyio
+async def test_performance_data_without_simulations_is_empty(client):
+    response = await client.get("/api/performance-data")
+    
+    assert response.status_code == 200
+    assert response.json() == []